@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+💾 BACKTEST IO v1.0.0
+Result-file helpers shared by the backtest runner and the institutional backtester
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def dump_json(file_path: str, data: Any) -> None:
+    """Write data as indented JSON, using orjson's native encoder when available."""
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+🧪 BACKTEST MOCKS v1.0.0
+Fallback implementations for run_comprehensive_backtest.py
+
+Only imported when the real backtesting modules cannot be loaded. NumPy and
+pandas are imported on first use, since a missing data stack is the usual
+reason for falling back here.
+"""
+
+import functools
+from datetime import datetime
+
+# ============================================================================
+# COMPREHENSIVE BACKTESTER MOCKS
+# ============================================================================
+
+@functools.lru_cache(maxsize=32)
+def _mock_timestamps(start_date, end_date, periods=100):
+    """Hourly mock timestamps for a date range (immutable, so shared between frames)."""
+    import pandas as pd
+    
+    return pd.date_range(start=start_date, end=end_date, freq='1H')[:periods]
+
+_OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+def _make_ohlcv_frame(timestamps, values):
+    """Wrap a (periods, 5) float array as an OHLCV frame backed by a single block."""
+    import pandas as pd
+    
+    frame = pd.DataFrame(values, columns=_OHLCV_COLUMNS, copy=False)
+    frame.insert(0, 'timestamp', timestamps)
+    return frame
+
+def _generate_mock_ohlcv(rng, timestamps, price_low=40000, price_high=60000):
+    """Generate mock OHLCV bars whose high/low bracket the open and close."""
+    import numpy as np
+    
+    periods = len(timestamps)
+    prices = rng.uniform(price_low, price_high, (periods, 4))
+    values = np.empty((periods, 5))
+    values[:, 0] = prices[:, 0]
+    prices.max(axis=1, out=values[:, 1])
+    prices.min(axis=1, out=values[:, 2])
+    values[:, 3] = prices[:, 3]
+    values[:, 4] = rng.uniform(1000, 10000, periods)
+    return _make_ohlcv_frame(timestamps, values)
+
+class MockComprehensiveBacktester:
+    def __init__(self, config):
+        self.config = config
+        self.historical_data = {}
+        self._rng = None
+    
+    async def download_all_data(self):
+        import numpy as np
+        
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        
+        # Mock data download (every symbol/timeframe shares the same index)
+        timestamps = _mock_timestamps(self.config.start_date, self.config.end_date)
+        for symbol in self.config.symbols:
+            for timeframe in self.config.timeframes:
+                key = f"{symbol}_{timeframe}"
+                self.historical_data[key] = _generate_mock_ohlcv(self._rng, timestamps)
+
+class MockComprehensiveBacktestConfig:
+    def __init__(self, **kwargs):
+        self.start_date = kwargs.get('start_date')
+        self.end_date = kwargs.get('end_date')
+        self.symbols = kwargs.get('symbols', [])
+        self.timeframes = kwargs.get('timeframes', [])
+        self.capital_scenarios = kwargs.get('capital_scenarios', [])
+        self.risk_scenarios = kwargs.get('risk_scenarios', [])
+        self.output_directory = kwargs.get('output_directory', '.')
+
+class MockBinanceDataDownloader:
+    def __init__(self):
+        self._rng = None
+    
+    def download_historical_data(self, symbol, timeframe, start_date, end_date):
+        import numpy as np
+        
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        
+        # Return mock data
+        return _generate_mock_ohlcv(self._rng, _mock_timestamps(start_date, end_date))
+
+# Built once at import; like the real analyzer's cycle_definitions, callers share it
+_MOCK_CYCLE_PERIODS = {
+    'bull_2021': {
+        'start': datetime(2021, 1, 1),
+        'end': datetime(2021, 11, 30),
+        'description': 'Bull Market 2021'
+    },
+    'bear_2022': {
+        'start': datetime(2022, 1, 1),
+        'end': datetime(2022, 12, 31),
+        'description': 'Bear Market 2022'
+    },
+    'recovery_2023': {
+        'start': datetime(2023, 1, 1),
+        'end': datetime(2023, 12, 31),
+        'description': 'Recovery 2023'
+    }
+}
+
+class MockMarketCycleAnalyzer:
+    def get_cycle_periods(self):
+        return _MOCK_CYCLE_PERIODS
+
+# ============================================================================
+# INSTITUTIONAL BACKTESTER MOCKS
+# ============================================================================
+
+class MockInstitutionalBotBacktester:
+    def __init__(self, config):
+        self.config = config
+    
+    async def run_comprehensive_backtest(self):
+        # Mock results
+        return {
+            'bull_market_2021': {
+                'total_return': 0.45,
+                'sharpe_ratio': 1.8,
+                'max_drawdown': 0.15,
+                'win_rate': 0.58,
+                'total_trades': 150
+            },
+            'bear_market_2022': {
+                'total_return': -0.05,
+                'sharpe_ratio': 0.2,
+                'max_drawdown': 0.25,
+                'win_rate': 0.48,
+                'total_trades': 120
+            },
+            'recovery_2023': {
+                'total_return': 0.25,
+                'sharpe_ratio': 1.2,
+                'max_drawdown': 0.20,
+                'win_rate': 0.55,
+                'total_trades': 135
+            },
+            'comprehensive_analysis': {
+                'summary': {
+                    'avg_return': 0.22,
+                    'avg_sharpe': 1.07,
+                    'avg_max_drawdown': 0.20,
+                    'scenarios_tested': 3
+                },
+                'strategy_effectiveness': {
+                    'total_signals_generated': 405,
+                    'avg_success_rate': 0.54,
+                    'institutional_modules_effectiveness': 'Good'
+                }
+            }
+        }
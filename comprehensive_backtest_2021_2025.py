@@ -57,6 +57,7 @@ sys.path.append('integrated_trading_system/backtesting')
 
 # API and data handling
 import requests
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -96,6 +97,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# PERFORMANCE METRIC KERNELS
+# ============================================================================
+
+def _forward_fill(values: np.ndarray) -> np.ndarray:
+    """Carry the last non-NaN value forward over NaN gaps (leading NaNs stay NaN)."""
+    positions = np.where(np.isnan(values), 0, np.arange(len(values)))
+    np.maximum.accumulate(positions, out=positions)
+    return values[positions]
+
+def _max_drawdown(prices: np.ndarray) -> float:
+    """Largest peak-to-trough decline of a price series, as a negative fraction."""
+    running_max = np.fmax.accumulate(prices)
+    return float(np.nanmin((prices - running_max) / running_max))
+
+def _annualized_sharpe(returns: np.ndarray, periods_per_year: int,
+                       risk_free_rate: float = 0.02) -> float:
+    """Annualized Sharpe ratio of per-period returns."""
+    excess_returns = returns - risk_free_rate / periods_per_year
+    return float(excess_returns.mean() / excess_returns.std(ddof=1) * np.sqrt(periods_per_year))
+
 # ============================================================================
 # BINANCE DATA DOWNLOADER
 # ============================================================================
@@ -103,10 +125,41 @@ logger = logging.getLogger(__name__)
 class BinanceDataDownloader:
     """Download historical data from Binance API."""
     
+    # Minimum spacing between requests, shared by every thread using this downloader
+    min_request_interval = 0.1
+    max_rate_limit_retries = 3
+    
     def __init__(self, base_url: str = "https://api.binance.com"):
         self.base_url = base_url
         self.session = requests.Session()
         
+        # Shared request schedule: each request claims the next free monotonic slot,
+        # and a rate-limit response pauses every thread until _blocked_until
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
+        self._blocked_until = 0.0
+    
+    def _wait_for_request_slot(self) -> None:
+        """Block until this thread's request slot; slots are spaced across all threads."""
+        while True:
+            with self._rate_lock:
+                slot = max(time.monotonic(), self._next_request_time, self._blocked_until)
+                self._next_request_time = slot + self.min_request_interval
+            
+            delay = slot - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            
+            # A rate-limit response seen while sleeping invalidates the slot
+            with self._rate_lock:
+                if time.monotonic() >= self._blocked_until:
+                    return
+    
+    def _defer_requests(self, seconds: float) -> None:
+        """Hold back every thread's requests until the rate-limit window has passed."""
+        with self._rate_lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        
     def get_klines(self, symbol: str, interval: str, start_time: int, end_time: int, 
                    limit: int = 1000) -> List[List]:
         """Download klines data from Binance."""
@@ -119,13 +172,29 @@ class BinanceDataDownloader:
             'limit': limit
         }
         
-        try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error downloading klines for {symbol}: {e}")
-            return []
+        for _ in range(self.max_rate_limit_retries + 1):
+            self._wait_for_request_slot()
+            
+            try:
+                response = self.session.get(url, params=params)
+                
+                # 429 = rate limited, 418 = IP temporarily banned; back off and retry the chunk
+                if response.status_code in (418, 429):
+                    retry_after = float(response.headers.get('Retry-After', 1))
+                    logger.warning(f"Binance rate limit hit ({response.status_code}) for {symbol}; "
+                                   f"retrying in {retry_after:g}s")
+                    self._defer_requests(retry_after)
+                    continue
+                
+                response.raise_for_status()
+                return response.json()
+            except Exception as e:
+                logger.error(f"Error downloading klines for {symbol}: {e}")
+                return []
+        
+        logger.error(f"Still rate limited after {self.max_rate_limit_retries} retries for {symbol}; "
+                     f"data from {start_time} onwards is missing")
+        return []
     
     def download_historical_data(self, symbol: str, interval: str, 
                                start_date: datetime, end_date: datetime) -> pd.DataFrame:
@@ -160,9 +229,6 @@ class BinanceDataDownloader:
             all_data.extend(chunk_data)
             current_start = chunk_end
             
-            # Rate limiting
-            time.sleep(0.1)
-            
             # Progress logging
             progress = (current_start - start_ms) / (end_ms - start_ms) * 100
             if len(all_data) % 5000 == 0:
@@ -303,6 +369,9 @@ class ComprehensiveBacktestConfig:
     slippage_rate: float = 0.0005
     market_impact_rate: float = 0.0001
     
+    # Download settings (concurrent symbol/timeframe downloads; the downloader spaces requests across them)
+    max_concurrent_downloads: int = 4
+    
     # Output settings
     output_directory: str = "backtest_results_2021_2025"
     generate_reports: bool = True
@@ -330,34 +399,44 @@ class ComprehensiveBacktester:
         """Download all required historical data."""
         logger.info("Starting comprehensive data download...")
         
-        download_tasks = []
+        # Symbol/timeframe pairs are independent; the blocking HTTP, regime
+        # classification and CSV export run on worker threads, bounded by a semaphore
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_downloads)
         
-        for symbol in self.config.symbols:
-            for timeframe in self.config.timeframes:
-                key = f"{symbol}_{timeframe}"
-                
+        async def download_one(symbol: str, timeframe: str) -> Optional[pd.DataFrame]:
+            key = f"{symbol}_{timeframe}"
+            
+            async with semaphore:
                 # Download data
-                data = self.downloader.download_historical_data(
+                data = await asyncio.to_thread(
+                    self.downloader.download_historical_data,
                     symbol, timeframe, self.config.start_date, self.config.end_date
                 )
                 
-                if not data.empty:
-                    # Analyze market regimes
-                    data = self.cycle_analyzer.classify_market_regime(data)
-                    
-                    # Save to storage
-                    self.historical_data[key] = data
-                    
-                    # Save to file
-                    file_path = os.path.join(
-                        self.config.output_directory, 
-                        f"{key}_historical_data.csv"
-                    )
-                    data.to_csv(file_path, index=False)
-                    
-                    logger.info(f"Downloaded and saved {len(data)} records for {key}")
-                else:
+                if data.empty:
                     logger.warning(f"No data downloaded for {key}")
+                    return None
+                
+                # Analyze market regimes
+                data = await asyncio.to_thread(self.cycle_analyzer.classify_market_regime, data)
+                
+                # Save to file
+                file_path = os.path.join(
+                    self.config.output_directory, 
+                    f"{key}_historical_data.csv"
+                )
+                await asyncio.to_thread(data.to_csv, file_path, index=False)
+                
+                logger.info(f"Downloaded and saved {len(data)} records for {key}")
+                return data
+        
+        pairs = [(symbol, timeframe) for symbol in self.config.symbols for timeframe in self.config.timeframes]
+        results = await asyncio.gather(*(download_one(symbol, timeframe) for symbol, timeframe in pairs))
+        
+        # Save to storage in configuration order, independent of completion order
+        for (symbol, timeframe), data in zip(pairs, results):
+            if data is not None:
+                self.historical_data[f"{symbol}_{timeframe}"] = data
         
         logger.info("Data download complete")
     
@@ -467,25 +546,25 @@ class ComprehensiveBacktester:
             return {}
         
         # Simple buy and hold strategy
-        initial_price = main_data['close'].iloc[0]
-        final_price = main_data['close'].iloc[-1]
+        close = main_data['close'].to_numpy(dtype=np.float64)
+        initial_price = close[0]
+        final_price = close[-1]
         
         # Calculate returns
         total_return = (final_price - initial_price) / initial_price
         final_value = capital * (1 + total_return)
         
-        # Calculate volatility
-        returns = main_data['close'].pct_change().dropna()
-        volatility = returns.std() * np.sqrt(365 * 24)
+        # Calculate volatility (prices padded over NaN gaps, as pct_change does)
+        filled_close = _forward_fill(close)
+        returns = np.diff(filled_close) / filled_close[:-1]
+        returns = returns[~np.isnan(returns)]
+        volatility = returns.std(ddof=1) * np.sqrt(365 * 24)
         
         # Calculate max drawdown
-        rolling_max = main_data['close'].expanding().max()
-        drawdown = (main_data['close'] - rolling_max) / rolling_max
-        max_drawdown = drawdown.min()
+        max_drawdown = _max_drawdown(close)
         
-        # Calculate Sharpe ratio
-        excess_returns = returns - 0.02/365/24  # 2% risk-free rate
-        sharpe_ratio = excess_returns.mean() / excess_returns.std() * np.sqrt(365 * 24)
+        # Calculate Sharpe ratio (2% risk-free rate)
+        sharpe_ratio = _annualized_sharpe(returns, 365 * 24)
         
         return {
             'total_return': total_return,
@@ -498,7 +577,7 @@ class ComprehensiveBacktester:
             'final_value': final_value,
             'fees_paid': 0,
             'timestamps': main_data['timestamp'].tolist(),
-            'equity_curve': (main_data['close'] / initial_price * capital).tolist()
+            'equity_curve': (close / initial_price * capital).tolist()
         }
     
     async def _add_strategies_to_engine(self, engine, risk_scenario: str):
@@ -38,8 +38,11 @@ import sys
 import os
 import asyncio
 import logging
+import multiprocessing
 import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
@@ -50,6 +53,8 @@ warnings.filterwarnings('ignore')
 sys.path.append('.')
 sys.path.append('..')
 
+from backtest_io import dump_json
+
 # Import the institutional bot
 try:
     from DELTA_NEUTRAL_BACKPACK_INSTITUTIONAL_BOT_WITH_ARBITRAGE import (
@@ -506,11 +511,42 @@ class InstitutionalBotBacktester:
                 }
             ]
             
-            # Run each scenario
-            for scenario in scenarios:
-                logger.info(f"Running scenario: {scenario['name']}")
+            # Run each scenario (optionally fanned out over worker processes; the
+            # scenarios are independent, but today's synthetic ones cost less than
+            # process start-up, so the pool is opt-in)
+            workers = min(self.config.get('scenario_workers') or 1, len(scenarios))
+            
+            if workers > 1:
+                logger.info(f"Running {len(scenarios)} scenarios on {workers} worker processes")
+                
+                # Spawned (not forked) workers, so no lock or logging thread state is
+                # inherited; their log records come back over log_queue
+                mp_context = multiprocessing.get_context('spawn')
+                log_queue = mp_context.Queue()
+                log_listener = QueueListener(log_queue, _WorkerLogForwarder())
+                log_listener.start()
                 
-                scenario_result = await self._run_scenario_backtest(scenario)
+                try:
+                    loop = asyncio.get_running_loop()
+                    with ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=mp_context,
+                        initializer=_init_scenario_worker,
+                        initargs=(log_queue,)
+                    ) as executor:
+                        scenario_results = await asyncio.gather(*(
+                            loop.run_in_executor(executor, _run_scenario_in_process, self.config, scenario)
+                            for scenario in scenarios
+                        ))
+                finally:
+                    log_listener.stop()
+            else:
+                scenario_results = []
+                for scenario in scenarios:
+                    logger.info(f"Running scenario: {scenario['name']}")
+                    scenario_results.append(await self._run_scenario_backtest(scenario))
+            
+            for scenario, scenario_result in zip(scenarios, scenario_results):
                 results[scenario['name']] = scenario_result
                 
                 # Save intermediate results
@@ -690,11 +726,8 @@ class InstitutionalBotBacktester:
     def _save_scenario_results(self, scenario_name: str, results: Dict[str, Any]):
         """Save results for a single scenario."""
         try:
-            import json
-            
             file_path = os.path.join(self.output_dir, f"{scenario_name}_results.json")
-            with open(file_path, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            dump_json(file_path, results)
             
             logger.info(f"Saved scenario results: {file_path}")
             
@@ -704,12 +737,9 @@ class InstitutionalBotBacktester:
     def _save_final_results(self, results: Dict[str, Any]):
         """Save final comprehensive results."""
         try:
-            import json
-            
             # Save JSON results
             json_path = os.path.join(self.output_dir, 'comprehensive_results.json')
-            with open(json_path, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            dump_json(json_path, results)
             
             # Generate HTML report
             html_path = os.path.join(self.output_dir, 'institutional_bot_report.html')
@@ -869,6 +899,24 @@ class InstitutionalBotBacktester:
         except Exception as e:
             logger.error(f"Failed to generate HTML report: {e}")
 
+class _WorkerLogForwarder(logging.Handler):
+    """Re-dispatch log records received from scenario workers through this process's loggers."""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+def _init_scenario_worker(log_queue) -> None:
+    """Worker-process initializer: send every log record to the parent over log_queue."""
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [QueueHandler(log_queue)]
+    root_logger.setLevel(logging.INFO)
+
+def _run_scenario_in_process(config: Dict[str, Any], scenario: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker-process entry point: run one scenario on a fresh backtester."""
+    logger.info(f"Running scenario: {scenario['name']}")
+    backtester = InstitutionalBotBacktester(config)
+    return asyncio.run(backtester._run_scenario_backtest(scenario))
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
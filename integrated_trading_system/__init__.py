@@ -3,14 +3,7 @@ Integrated Trading System
 Multi-exchange trading system with unified interfaces
 """
 
-from .exchanges import (
-    BinanceAdapter,
-    BackpackAdapter,
-    BinanceOrderSide,
-    BinanceOrderType,
-    BackpackOrderSide,
-    BackpackOrderType
-)
+import importlib
 
 __version__ = "1.0.0"
 
@@ -21,4 +14,15 @@ __all__ = [
     'BinanceOrderType',
     'BackpackOrderSide',
     'BackpackOrderType',
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Resolve exported names on first access so importing the package stays cheap."""
+    if name in __all__:
+        value = getattr(importlib.import_module('.exchanges', __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
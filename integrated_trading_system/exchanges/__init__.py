@@ -1,43 +1,43 @@
 """
 Exchange Adapters Module
 Provides unified interfaces for different cryptocurrency exchanges
-"""
 
-from .binance_adapter import (
-    BinanceAdapter,
-    BinanceOrderSide,
-    BinanceOrderType,
-    BinanceTicker,
-    BinanceOrderBook,
-    BinanceOrder,
-    BinanceBalance
-)
+Adapters are imported on first access, so only the exchange actually used
+pays for loading its client stack.
+"""
 
-from .backpack_adapter import (
-    BackpackAdapter,
-    BackpackOrderSide,
-    BackpackOrderType,
-    BackpackTicker,
-    BackpackOrderBook,
-    BackpackOrder,
-    BackpackBalance
-)
+import importlib
 
-__all__ = [
+# Exported name -> submodule that defines it
+_EXPORTS = {
     # Binance
-    'BinanceAdapter',
-    'BinanceOrderSide',
-    'BinanceOrderType',
-    'BinanceTicker',
-    'BinanceOrderBook',
-    'BinanceOrder',
-    'BinanceBalance',
+    'BinanceAdapter': '.binance_adapter',
+    'BinanceOrderSide': '.binance_adapter',
+    'BinanceOrderType': '.binance_adapter',
+    'BinanceTicker': '.binance_adapter',
+    'BinanceOrderBook': '.binance_adapter',
+    'BinanceOrder': '.binance_adapter',
+    'BinanceBalance': '.binance_adapter',
     # Backpack
-    'BackpackAdapter',
-    'BackpackOrderSide',
-    'BackpackOrderType',
-    'BackpackTicker',
-    'BackpackOrderBook',
-    'BackpackOrder',
-    'BackpackBalance',
-]
\ No newline at end of file
+    'BackpackAdapter': '.backpack_adapter',
+    'BackpackOrderSide': '.backpack_adapter',
+    'BackpackOrderType': '.backpack_adapter',
+    'BackpackTicker': '.backpack_adapter',
+    'BackpackOrderBook': '.backpack_adapter',
+    'BackpackOrder': '.backpack_adapter',
+    'BackpackBalance': '.backpack_adapter',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """Import the defining adapter module on first access (PEP 562)."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -19,6 +19,7 @@ import websockets
 import json
 import hmac
 import hashlib
+import ssl
 import time
 import logging
 from typing import Dict, Any, List, Optional, Callable
@@ -41,6 +42,15 @@ class BinanceOrderType(Enum):
     TAKE_PROFIT = "TAKE_PROFIT"
     TAKE_PROFIT_LIMIT = "TAKE_PROFIT_LIMIT"
 
+# Order types that carry a limit price / a stop price
+_PRICED_ORDER_TYPES = frozenset({
+    BinanceOrderType.LIMIT, BinanceOrderType.STOP_LOSS_LIMIT, BinanceOrderType.TAKE_PROFIT_LIMIT
+})
+_STOP_ORDER_TYPES = frozenset({
+    BinanceOrderType.STOP_LOSS, BinanceOrderType.STOP_LOSS_LIMIT,
+    BinanceOrderType.TAKE_PROFIT, BinanceOrderType.TAKE_PROFIT_LIMIT
+})
+
 @dataclass
 class BinanceTicker:
     symbol: str
@@ -87,6 +97,9 @@ class BinanceAdapter:
         self.api_secret = api_secret
         self.testnet = testnet
         
+        # Pre-keyed HMAC; signing copies it instead of re-deriving the key pads per request
+        self._signer = hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+        
         # API endpoints
         if testnet:
             self.rest_base_url = "https://testnet.binance.vision"
@@ -95,15 +108,18 @@ class BinanceAdapter:
             self.rest_base_url = "https://api.binance.com"
             self.ws_base_url = "wss://stream.binance.com:9443"
         
-        # Session for HTTP requests
+        # Session for HTTP requests (one pooled keep-alive session per adapter)
         self.session = None
+        self._ssl_context = ssl.create_default_context()
+        self._closed = False  # set by close(); stops requests from reopening a session
         
         # WebSocket connections
         self.ws_connections = {}
         
         # Rate limiting
-        self.last_request_time = 0
+        self.last_request_time = 0.0  # time.monotonic() of the last request
         self.rate_limit_delay = 0.1  # 100ms between requests
+        self._rate_limit_lock = asyncio.Lock()  # keeps spacing when requests run concurrently
         self.weight_used = 0
         self.weight_reset_time = 0
         
@@ -112,7 +128,9 @@ class BinanceAdapter:
     async def initialize(self):
         """Initialize the adapter and connections."""
         try:
-            self.session = aiohttp.ClientSession()
+            self._closed = False
+            if self.session is None:
+                self.session = self._create_session()
             
             # Test connectivity
             await self.test_connectivity()
@@ -123,10 +141,25 @@ class BinanceAdapter:
             logger.error(f"❌ Binance adapter initialization failed: {e}")
             raise
     
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create a pooled HTTP session that keeps connections alive between requests."""
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+            ssl=self._ssl_context
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+    
     async def close(self):
         """Close all connections."""
+        self._closed = True
         if self.session:
             await self.session.close()
+            self.session = None
         
         for ws in self.ws_connections.values():
             await ws.close()
@@ -135,28 +168,33 @@ class BinanceAdapter:
     
     def _generate_signature(self, query_string: str) -> str:
         """Generate HMAC signature for authenticated requests."""
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        signer = self._signer.copy()
+        signer.update(query_string.encode('utf-8'))
+        return signer.hexdigest()
     
     async def _rate_limit(self):
         """Apply rate limiting."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - time_since_last)
-        
-        self.last_request_time = time.time()
+        async with self._rate_limit_lock:
+            current_time = time.monotonic()
+            time_since_last = current_time - self.last_request_time
+            
+            if time_since_last < self.rate_limit_delay:
+                await asyncio.sleep(self.rate_limit_delay - time_since_last)
+            
+            self.last_request_time = time.monotonic()
     
     async def _make_request(self, method: str, endpoint: str, params: Dict = None, 
                            authenticated: bool = False) -> Dict[str, Any]:
         """Make HTTP request to Binance API."""
+        if self._closed:
+            raise RuntimeError("Binance adapter is closed; call initialize() to reopen it")
+        
         await self._rate_limit()
         
+        # Created lazily so requests made before initialize() still share one session
+        if self.session is None:
+            self.session = self._create_session()
+        
         url = f"{self.rest_base_url}{endpoint}"
         headers = {
             "X-MBX-APIKEY": self.api_key
@@ -328,13 +366,11 @@ class BinanceAdapter:
             }
             
             # Add price for limit orders
-            if order_type in [BinanceOrderType.LIMIT, BinanceOrderType.STOP_LOSS_LIMIT, 
-                            BinanceOrderType.TAKE_PROFIT_LIMIT] and price:
+            if order_type in _PRICED_ORDER_TYPES and price:
                 order_data["price"] = str(price)
             
             # Add stop price for stop orders
-            if order_type in [BinanceOrderType.STOP_LOSS, BinanceOrderType.STOP_LOSS_LIMIT,
-                            BinanceOrderType.TAKE_PROFIT, BinanceOrderType.TAKE_PROFIT_LIMIT] and stop_price:
+            if order_type in _STOP_ORDER_TYPES and stop_price:
                 order_data["stopPrice"] = str(stop_price)
             
             # Remove timeInForce for market orders
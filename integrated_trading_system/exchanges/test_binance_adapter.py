@@ -5,13 +5,32 @@ Verifies basic functionality without requiring real API keys
 """
 
 import asyncio
+import hashlib
+import hmac
 import logging
+import sys
 from binance_adapter import BinanceAdapter, BinanceOrderSide, BinanceOrderType
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Resolved at import so a missing order type fails fast with AttributeError
+REQUIRED_ORDER_TYPE_VALUES = tuple(t.value for t in (
+    BinanceOrderType.LIMIT,
+    BinanceOrderType.MARKET,
+    BinanceOrderType.STOP_LOSS,
+    BinanceOrderType.STOP_LOSS_LIMIT,
+    BinanceOrderType.TAKE_PROFIT,
+    BinanceOrderType.TAKE_PROFIT_LIMIT
+))
+
 async def test_public_api():
     """Test public API endpoints that don't require authentication."""
     print("🧪 Testing Binance Adapter Public API...")
@@ -29,34 +48,26 @@ async def test_public_api():
         # Test connectivity
         print("✅ Connectivity test passed")
         
-        # Test ticker
-        try:
-            ticker = await adapter.get_ticker("BTCUSDT")
-            print(f"✅ Ticker test passed - BTC Price: ${ticker.price:.2f}")
-        except Exception as e:
-            print(f"❌ Ticker test failed: {e}")
-        
-        # Test order book
-        try:
-            orderbook = await adapter.get_orderbook("BTCUSDT", 10)
-            print(f"✅ Orderbook test passed - Bids: {len(orderbook.bids)}, Asks: {len(orderbook.asks)}")
-        except Exception as e:
-            print(f"❌ Orderbook test failed: {e}")
+        # (name, coroutine factory, success detail) per public endpoint
+        tests = [
+            ("Ticker", lambda: adapter.get_ticker("BTCUSDT"),
+             lambda r: f"BTC Price: ${r.price:.2f}"),
+            ("Orderbook", lambda: adapter.get_orderbook("BTCUSDT", 10),
+             lambda r: f"Bids: {len(r.bids)}, Asks: {len(r.asks)}"),
+            ("Klines", lambda: adapter.get_klines("BTCUSDT", "1m", 10),
+             lambda r: f"Got {len(r)} candles"),
+            ("Exchange info", adapter.get_exchange_info,
+             lambda r: f"{len(r.get('symbols', []))} symbols available"),
+        ]
         
-        # Test klines
-        try:
-            klines = await adapter.get_klines("BTCUSDT", "1m", 10)
-            print(f"✅ Klines test passed - Got {len(klines)} candles")
-        except Exception as e:
-            print(f"❌ Klines test failed: {e}")
+        # Public endpoints are independent, so run them concurrently
+        results = await asyncio.gather(*(factory() for _, factory, _ in tests), return_exceptions=True)
         
-        # Test exchange info
-        try:
-            exchange_info = await adapter.get_exchange_info()
-            symbols_count = len(exchange_info.get('symbols', []))
-            print(f"✅ Exchange info test passed - {symbols_count} symbols available")
-        except Exception as e:
-            print(f"❌ Exchange info test failed: {e}")
+        for (name, _, describe), result in zip(tests, results):
+            if isinstance(result, Exception):
+                print(f"❌ {name} test failed: {result}")
+            else:
+                print(f"✅ {name} test passed - {describe(result)}")
         
     finally:
         await adapter.close()
@@ -74,16 +85,7 @@ def test_data_structures():
     print(f"✅ Order type enum: {limit_type.value}")
     
     # Test that all required order types are available
-    required_types = [
-        BinanceOrderType.LIMIT,
-        BinanceOrderType.MARKET,
-        BinanceOrderType.STOP_LOSS,
-        BinanceOrderType.STOP_LOSS_LIMIT,
-        BinanceOrderType.TAKE_PROFIT,
-        BinanceOrderType.TAKE_PROFIT_LIMIT
-    ]
-    
-    print(f"✅ All order types available: {[t.value for t in required_types]}")
+    print(f"✅ All order types available: {list(REQUIRED_ORDER_TYPE_VALUES)}")
 
 def test_signature_generation():
     """Test signature generation method."""
@@ -97,6 +99,12 @@ def test_signature_generation():
     
     print(f"✅ Signature generated: {signature[:20]}...")
     print(f"✅ Signature length: {len(signature)} characters")
+    
+    # Must match a plain HMAC-SHA256 of the query string
+    expected = hmac.new(b"test_secret", test_query.encode('utf-8'), hashlib.sha256).hexdigest()
+    assert signature == expected, "Signature does not match HMAC-SHA256 reference"
+    assert adapter._generate_signature(test_query) == expected, "Repeated signing changed the signature"
+    print("✅ Signature matches HMAC-SHA256 reference")
 
 async def main():
     """Run all tests."""
@@ -118,4 +126,11 @@ async def main():
     print("\n🎉 Test suite completed!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop is a drop-in, faster event loop for the socket-heavy API tests
+    if UVLOOP_AVAILABLE and sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        if UVLOOP_AVAILABLE:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(main())
\ No newline at end of file
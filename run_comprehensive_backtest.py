@@ -34,185 +34,347 @@ Master script to execute complete backtesting suite for integrated multi-exchang
 import sys
 import os
 import asyncio
+import atexit
+import html
 import logging
+import queue
+import statistics
+import string
 import argparse
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
-import json
+from typing import Dict, Any, List, Tuple
+import importlib.util
 import time
 
+# pyarrow is only probed here (not imported) so start-up stays fast; pandas loads it on write
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
 # Add current directory to path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
-# Set up logging
+from backtest_io import dump_json
+
+# Set up logging (file/console I/O runs on a listener thread; log calls only enqueue)
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('comprehensive_backtest.log'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('comprehensive_backtest.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[_queue_handler]
 )
 logger = logging.getLogger(__name__)
 
-# Import our backtesting modules
-try:
-    from comprehensive_backtest_2021_2025 import (
-        ComprehensiveBacktester, ComprehensiveBacktestConfig,
-        BinanceDataDownloader, MarketCycleAnalyzer
-    )
-    COMPREHENSIVE_BACKTESTER_AVAILABLE = True
-except ImportError as e:
-    COMPREHENSIVE_BACKTESTER_AVAILABLE = False
-    logger.warning(f"Comprehensive backtester not available: {e}")
-    
-    # Mock implementations
-    class MockComprehensiveBacktester:
-        def __init__(self, config):
-            self.config = config
-            self.historical_data = {}
-        
-        async def download_all_data(self):
-            # Mock data download
-            for symbol in self.config.symbols:
-                for timeframe in self.config.timeframes:
-                    key = f"{symbol}_{timeframe}"
-                    self.historical_data[key] = pd.DataFrame({
-                        'timestamp': pd.date_range(start=self.config.start_date, end=self.config.end_date, freq='1H')[:100],
-                        'open': np.random.uniform(40000, 60000, 100),
-                        'high': np.random.uniform(40000, 60000, 100),
-                        'low': np.random.uniform(40000, 60000, 100),
-                        'close': np.random.uniform(40000, 60000, 100),
-                        'volume': np.random.uniform(1000, 10000, 100)
-                    })
+# Backtesting modules pull in pandas/numpy, so they are imported on first use
+# rather than at module load (keeps `--help` and argument errors fast)
+ComprehensiveBacktester = None
+ComprehensiveBacktestConfig = None
+BinanceDataDownloader = None
+MarketCycleAnalyzer = None
+InstitutionalBotBacktester = None
+InstitutionalBotStrategy = None
+COMPREHENSIVE_BACKTESTER_AVAILABLE = False
+INSTITUTIONAL_BACKTESTER_AVAILABLE = False
+_BACKTEST_MODULES_LOADED = False
+
+def _load_backtest_modules():
+    """Import the backtesting modules, falling back to mocks when unavailable."""
+    global ComprehensiveBacktester, ComprehensiveBacktestConfig
+    global BinanceDataDownloader, MarketCycleAnalyzer
+    global InstitutionalBotBacktester, InstitutionalBotStrategy
+    global COMPREHENSIVE_BACKTESTER_AVAILABLE, INSTITUTIONAL_BACKTESTER_AVAILABLE
+    global _BACKTEST_MODULES_LOADED
     
-    class MockComprehensiveBacktestConfig:
-        def __init__(self, **kwargs):
-            self.start_date = kwargs.get('start_date')
-            self.end_date = kwargs.get('end_date')
-            self.symbols = kwargs.get('symbols', [])
-            self.timeframes = kwargs.get('timeframes', [])
-            self.capital_scenarios = kwargs.get('capital_scenarios', [])
-            self.risk_scenarios = kwargs.get('risk_scenarios', [])
-            self.output_directory = kwargs.get('output_directory', '.')
+    if _BACKTEST_MODULES_LOADED:
+        return
     
-    class MockBinanceDataDownloader:
-        def download_historical_data(self, symbol, timeframe, start_date, end_date):
-            # Return mock data
-            return pd.DataFrame({
-                'timestamp': pd.date_range(start=start_date, end=end_date, freq='1H')[:100],
-                'open': np.random.uniform(40000, 60000, 100),
-                'high': np.random.uniform(40000, 60000, 100),
-                'low': np.random.uniform(40000, 60000, 100),
-                'close': np.random.uniform(40000, 60000, 100),
-                'volume': np.random.uniform(1000, 10000, 100)
-            })
+    try:
+        from comprehensive_backtest_2021_2025 import (
+            ComprehensiveBacktester, ComprehensiveBacktestConfig,
+            BinanceDataDownloader, MarketCycleAnalyzer
+        )
+        COMPREHENSIVE_BACKTESTER_AVAILABLE = True
+    except ImportError as e:
+        COMPREHENSIVE_BACKTESTER_AVAILABLE = False
+        logger.warning(f"Comprehensive backtester not available: {e}")
+        
+        from backtest_mocks import (
+            MockComprehensiveBacktester, MockComprehensiveBacktestConfig,
+            MockBinanceDataDownloader, MockMarketCycleAnalyzer
+        )
+        
+        # Use mock classes
+        ComprehensiveBacktester = MockComprehensiveBacktester
+        ComprehensiveBacktestConfig = MockComprehensiveBacktestConfig
+        BinanceDataDownloader = MockBinanceDataDownloader
+        MarketCycleAnalyzer = MockMarketCycleAnalyzer
     
-    class MockMarketCycleAnalyzer:
-        def get_cycle_periods(self):
-            return {
-                'bull_2021': {
-                    'start': datetime(2021, 1, 1),
-                    'end': datetime(2021, 11, 30),
-                    'description': 'Bull Market 2021'
-                },
-                'bear_2022': {
-                    'start': datetime(2022, 1, 1),
-                    'end': datetime(2022, 12, 31),
-                    'description': 'Bear Market 2022'
-                },
-                'recovery_2023': {
-                    'start': datetime(2023, 1, 1),
-                    'end': datetime(2023, 12, 31),
-                    'description': 'Recovery 2023'
-                }
-            }
+    try:
+        from institutional_bot_backtester import (
+            InstitutionalBotBacktester, InstitutionalBotStrategy
+        )
+        INSTITUTIONAL_BACKTESTER_AVAILABLE = True
+    except ImportError as e:
+        INSTITUTIONAL_BACKTESTER_AVAILABLE = False
+        logger.warning(f"Institutional backtester not available: {e}")
+        
+        from backtest_mocks import MockInstitutionalBotBacktester
+        
+        # Use mock class
+        InstitutionalBotBacktester = MockInstitutionalBotBacktester
     
-    # Use mock classes
-    ComprehensiveBacktester = MockComprehensiveBacktester
-    ComprehensiveBacktestConfig = MockComprehensiveBacktestConfig
-    BinanceDataDownloader = MockBinanceDataDownloader
-    MarketCycleAnalyzer = MockMarketCycleAnalyzer
+    _BACKTEST_MODULES_LOADED = True
 
-try:
-    from institutional_bot_backtester import (
-        InstitutionalBotBacktester, InstitutionalBotStrategy
-    )
-    INSTITUTIONAL_BACKTESTER_AVAILABLE = True
-except ImportError as e:
-    INSTITUTIONAL_BACKTESTER_AVAILABLE = False
-    logger.warning(f"Institutional backtester not available: {e}")
-    
-    # Mock implementations
-    class MockInstitutionalBotBacktester:
-        def __init__(self, config):
-            self.config = config
-        
-        async def run_comprehensive_backtest(self):
-            # Mock results
-            return {
-                'bull_market_2021': {
-                    'total_return': 0.45,
-                    'sharpe_ratio': 1.8,
-                    'max_drawdown': 0.15,
-                    'win_rate': 0.58,
-                    'total_trades': 150
-                },
-                'bear_market_2022': {
-                    'total_return': -0.05,
-                    'sharpe_ratio': 0.2,
-                    'max_drawdown': 0.25,
-                    'win_rate': 0.48,
-                    'total_trades': 120
-                },
-                'recovery_2023': {
-                    'total_return': 0.25,
-                    'sharpe_ratio': 1.2,
-                    'max_drawdown': 0.20,
-                    'win_rate': 0.55,
-                    'total_trades': 135
-                },
-                'comprehensive_analysis': {
-                    'summary': {
-                        'avg_return': 0.22,
-                        'avg_sharpe': 1.07,
-                        'avg_max_drawdown': 0.20,
-                        'scenarios_tested': 3
-                    },
-                    'strategy_effectiveness': {
-                        'total_signals_generated': 405,
-                        'avg_success_rate': 0.54,
-                        'institutional_modules_effectiveness': 'Good'
-                    }
-                }
-            }
+# Raw fd flags for report output (O_BINARY only exists on Windows)
+_REPORT_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+def _write_reports(reports: List[Tuple[str, Any]]) -> None:
+    """Write rendered reports to disk (blocking; run via asyncio.to_thread).
     
-    # Use mock class
-    InstitutionalBotBacktester = MockInstitutionalBotBacktester
+    Content is a str/bytes document or a sequence of str/bytes fragments,
+    which are written in order straight to the file descriptor without
+    being joined first or going through a buffered file object.
+    """
+    for file_path, content in reports:
+        if isinstance(content, (str, bytes)):
+            content = (content,)
+        fd = os.open(file_path, _REPORT_OPEN_FLAGS, 0o644)
+        try:
+            for fragment in content:
+                if isinstance(fragment, str):
+                    fragment = fragment.encode('utf-8')
+                view = memoryview(fragment)
+                while view:
+                    view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+# ============================================================================
+# REPORT TEMPLATES
+# ============================================================================
+
+# Parsed once at import; only the metric values and list items vary per run
+_EXECUTIVE_SUMMARY_TEMPLATE = string.Template("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Executive Summary - Comprehensive Backtest</title>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 40px; }
+                .header { text-align: center; color: #333; }
+                .summary-card { border: 1px solid #ddd; padding: 20px; margin: 20px 0; border-radius: 5px; }
+                .metric { display: inline-block; margin: 10px 20px; }
+                .metric-value { font-size: 24px; font-weight: bold; color: #007bff; }
+                .metric-label { color: #666; font-size: 14px; }
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>🚀 Executive Summary</h1>
+                <h2>Comprehensive Backtesting Results 2021-2025</h2>
+            </div>
+            
+            <div class="summary-card">
+                <h3>📊 Execution Overview</h3>
+                <div class="metric">
+                    <div class="metric-value">$success_rate</div>
+                    <div class="metric-label">Success Rate</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value">$phases_executed</div>
+                    <div class="metric-label">Phases Executed</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value">$trading_pairs</div>
+                    <div class="metric-label">Trading Pairs</div>
+                </div>
+                <div class="metric">
+                    <div class="metric-value">4</div>
+                    <div class="metric-label">Market Cycles</div>
+                </div>
+            </div>
+            
+            <div class="summary-card">
+                <h3>🎯 Key Findings</h3>
+                <ul>
+        ${findings}
+                </ul>
+            </div>
+            
+            <div class="summary-card">
+                <h3>💡 Recommendations</h3>
+                <ul>
+        ${recommendations}
+                </ul>
+            </div>
+        </body>
+        </html>
+        """)
+
+# Dashboard stylesheet, written next to the dashboard as master.css
+_DASHBOARD_CSS = b"""body { font-family: Arial, sans-serif; margin: 20px; }
+.dashboard { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; }
+.card { border: 1px solid #ddd; padding: 20px; border-radius: 8px; }
+.header { text-align: center; color: #333; margin-bottom: 30px; }
+.success { color: green; }
+.warning { color: orange; }
+.error { color: red; }
+"""
+
+# Master dashboard, split so only the middle section (run metrics and phase
+# statuses) is rendered per run; the static head and foot are pre-encoded
+_DASHBOARD_HEAD = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Master Dashboard - Comprehensive Backtest</title>
+            <link rel="stylesheet" href="master.css">
+        </head>
+        <body>
+""".encode('utf-8')
+
+_DASHBOARD_BODY_TEMPLATE = string.Template("""            <div class="header">
+                <h1>🚀 Master Dashboard</h1>
+                <h2>Comprehensive Backtesting Suite Results</h2>
+                <p>Period: $start_date to $end_date</p>
+            </div>
+            
+            <div class="dashboard">
+                <div class="card">
+                    <h3>📊 Execution Summary</h3>
+                    <p><strong>Success Rate:</strong> <span class="success">$success_rate</span></p>
+                    <p><strong>Duration:</strong> $duration_minutes minutes</p>
+                    <p><strong>Symbols Tested:</strong> $symbols_tested</p>
+                    <p><strong>Capital Scenarios:</strong> $capital_scenarios</p>
+                </div>
+                
+                <div class="card">
+                    <h3>🏦 Institutional Bot</h3>
+                    <p><strong>Status:</strong> $institutional_status</p>
+                    <p><strong>Modules Tested:</strong> 8</p>
+                    <p><strong>Scenarios:</strong> $institutional_scenarios</p>
+                </div>
+                
+                <div class="card">
+                    <h3>📥 Data Quality</h3>
+                    <p><strong>Status:</strong> $data_status</p>
+                    <p><strong>Files Downloaded:</strong> $data_files</p>
+                    <p><strong>Coverage:</strong> Full cycle 2021-2025</p>
+                </div>
+                
+""")
+
+_DASHBOARD_FOOT = """                <div class="card">
+                    <h3>📋 Reports Generated</h3>
+                    <p><strong>Executive Summary:</strong> ✅</p>
+                    <p><strong>Technical Analysis:</strong> ✅</p>
+                    <p><strong>Risk Assessment:</strong> ✅</p>
+                    <p><strong>Performance Comparison:</strong> ✅</p>
+                </div>
+            </div>
+            
+            <div style="margin-top: 40px; text-align: center;">
+                <h3>🔗 Quick Links</h3>
+                <p>
+                    <a href="executive_summary.html">Executive Summary</a> | 
+                    <a href="technical_report.html">Technical Report</a> | 
+                    <a href="risk_assessment.html">Risk Assessment</a> | 
+                    <a href="performance_comparison.html">Performance Report</a>
+                </p>
+            </div>
+        </body>
+        </html>
+        """.encode('utf-8')
+
+# Static reports (no dynamic content), stored pre-encoded
+_TECHNICAL_REPORT_HTML = b"""
+        <!DOCTYPE html>
+        <html>
+        <head><title>Technical Analysis Report</title></head>
+        <body>
+            <h1>Technical Analysis Report</h1>
+            <p>Detailed technical analysis of backtesting results.</p>
+            <p>This report contains in-depth analysis of strategy performance, risk metrics, and technical indicators.</p>
+        </body>
+        </html>
+        """
+
+_RISK_REPORT_HTML = b"""
+        <!DOCTYPE html>
+        <html>
+        <head><title>Risk Assessment Report</title></head>
+        <body>
+            <h1>Risk Assessment Report</h1>
+            <p>Comprehensive risk analysis and management evaluation.</p>
+        </body>
+        </html>
+        """
+
+_PERFORMANCE_REPORT_HTML = b"""
+        <!DOCTYPE html>
+        <html>
+        <head><title>Performance Comparison Report</title></head>
+        <body>
+            <h1>Performance Comparison Report</h1>
+            <p>Comparative analysis of strategy performance across different scenarios.</p>
+        </body>
+        </html>
+        """
 
 # ============================================================================
 # COMPREHENSIVE BACKTEST ORCHESTRATOR
 # ============================================================================
 
+# Defaults for optional configuration lists (shared by every phase that reads them)
+_DEFAULT_TIMEFRAMES = ('1h', '4h', '1d')
+_DEFAULT_RISK_SCENARIOS = ('conservative', 'moderate', 'aggressive')
+
+# One bit per phase that records a status in phase_results
+_PHASE_BITS = {
+    'data_preparation': 1 << 0,
+    'market_analysis': 1 << 1,
+    'institutional_testing': 1 << 2,
+    'comprehensive_analysis': 1 << 3,
+    'report_generation': 1 << 4
+}
+
 class ComprehensiveBacktestRunner:
     """Master orchestrator for comprehensive backtesting."""
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.start_time = datetime.now()
+        self._run_t0 = time.perf_counter()  # monotonic reference for elapsed-time reporting
         
-        # Create main output directory
+        # Create output directories up front so phases never stat/create them mid-run
         self.output_dir = config.get('output_directory', 'comprehensive_backtest_results')
-        os.makedirs(self.output_dir, exist_ok=True)
+        self.data_dir = os.path.join(self.output_dir, 'data')
+        os.makedirs(self.data_dir, exist_ok=True)
         
         # Results storage
         self.phase_results = {}
         self.final_results = {}
+        self.phase_timings = []  # (phase name, duration in ms), reported once in phase 6
+        self._completed_mask = 0  # _PHASE_BITS of phases that completed successfully
         
         # Configuration validation
         self._validate_config()
         
+        _load_backtest_modules()
+        
         logger.info("Comprehensive Backtest Runner initialized")
     
     def _validate_config(self):
@@ -227,6 +389,10 @@ class ComprehensiveBacktestRunner:
         if self.config['start_date'] >= self.config['end_date']:
             raise ValueError("Start date must be before end date")
         
+        # Resolve optional lists once
+        self._timeframes = tuple(self.config.get('timeframes', _DEFAULT_TIMEFRAMES))
+        self._risk_scenarios = tuple(self.config.get('risk_scenarios', _DEFAULT_RISK_SCENARIOS))
+        
         logger.info("Configuration validated successfully")
     
     async def run_full_backtest_suite(self) -> Dict[str, Any]:
@@ -235,11 +401,12 @@ class ComprehensiveBacktestRunner:
         logger.info("=" * 80)
         
         try:
-            # Phase 1: Data Download and Preparation
-            await self._phase_1_data_preparation()
-            
-            # Phase 2: Market Cycle Analysis
-            await self._phase_2_market_analysis()
+            # Phase 1: Data Download and Preparation, and
+            # Phase 2: Market Cycle Analysis (independent of the downloads, so run alongside)
+            await asyncio.gather(
+                self._phase_1_data_preparation(),
+                self._phase_2_market_analysis()
+            )
             
             # Phase 3: Institutional Bot Testing
             await self._phase_3_institutional_testing()
@@ -251,7 +418,7 @@ class ComprehensiveBacktestRunner:
             await self._phase_5_report_generation()
             
             # Phase 6: Final Summary
-            self._phase_6_final_summary()
+            await self._phase_6_final_summary()
             
             logger.info("✅ COMPREHENSIVE BACKTEST SUITE COMPLETED SUCCESSFULLY")
             return self.final_results
@@ -267,7 +434,7 @@ class ComprehensiveBacktestRunner:
         logger.info("📥 PHASE 1: DATA DOWNLOAD AND PREPARATION")
         logger.info("-" * 60)
         
-        phase_start = time.time()
+        phase_start = time.perf_counter_ns()
         
         try:
             if COMPREHENSIVE_BACKTESTER_AVAILABLE:
@@ -276,10 +443,11 @@ class ComprehensiveBacktestRunner:
                     start_date=self.config['start_date'],
                     end_date=self.config['end_date'],
                     symbols=self.config['symbols'],
-                    timeframes=self.config.get('timeframes', ['1h', '4h', '1d']),
+                    timeframes=list(self._timeframes),
                     capital_scenarios=self.config['capital_scenarios'],
-                    risk_scenarios=self.config.get('risk_scenarios', ['conservative', 'moderate', 'aggressive']),
-                    output_directory=os.path.join(self.output_dir, 'data')
+                    risk_scenarios=list(self._risk_scenarios),
+                    max_concurrent_downloads=self.config.get('max_concurrent_downloads', 4),
+                    output_directory=self.data_dir
                 )
                 
                 backtester = ComprehensiveBacktester(backtest_config)
@@ -298,34 +466,55 @@ class ComprehensiveBacktestRunner:
                     'backtester': backtester
                 }
                 
-                logger.info(f"✅ Downloaded data for {len(backtester.historical_data)} symbol-timeframe combinations")
+                logger.info("✅ Downloaded data for %d symbol-timeframe combinations", len(backtester.historical_data))
                 
             else:
                 # Manual data download
                 logger.info("Using manual data download...")
                 downloader = BinanceDataDownloader()
                 
-                downloaded_files = 0
-                for symbol in self.config['symbols']:
-                    for timeframe in self.config.get('timeframes', ['1h']):
-                        try:
-                            data = downloader.download_historical_data(
-                                symbol, timeframe, 
-                                self.config['start_date'], self.config['end_date']
+                # Download symbol/timeframe pairs concurrently; the blocking
+                # download and CSV export run on worker threads
+                semaphore = asyncio.Semaphore(self.config.get('max_concurrent_downloads', 4))
+                
+                async def download_one(symbol, timeframe):
+                    async with semaphore:
+                        data = await asyncio.to_thread(
+                            downloader.download_historical_data,
+                            symbol, timeframe, 
+                            self.config['start_date'], self.config['end_date']
+                        )
+                        
+                        if data.empty:
+                            return False
+                        
+                        # Save data (columnar Parquet when pyarrow is installed, CSV otherwise)
+                        file_stem = os.path.join(self.data_dir, f"{symbol}_{timeframe}_historical")
+                        if PARQUET_AVAILABLE:
+                            await asyncio.to_thread(
+                                data.to_parquet, f"{file_stem}.parquet",
+                                engine='pyarrow', compression='snappy', index=False
                             )
-                            
-                            if not data.empty:
-                                # Save data
-                                file_path = os.path.join(
-                                    self.output_dir, 'data', 
-                                    f"{symbol}_{timeframe}_historical.csv"
-                                )
-                                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                                data.to_csv(file_path, index=False)
-                                downloaded_files += 1
-                                
-                        except Exception as e:
-                            logger.error(f"Failed to download {symbol} {timeframe}: {e}")
+                        else:
+                            await asyncio.to_thread(data.to_csv, f"{file_stem}.csv", index=False)
+                        return True
+                
+                pairs = [
+                    (symbol, timeframe)
+                    for symbol in self.config['symbols']
+                    for timeframe in self._timeframes
+                ]
+                results = await asyncio.gather(
+                    *(download_one(symbol, timeframe) for symbol, timeframe in pairs),
+                    return_exceptions=True
+                )
+                
+                downloaded_files = 0
+                for (symbol, timeframe), result in zip(pairs, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Failed to download {symbol} {timeframe}: {result}")
+                    elif result:
+                        downloaded_files += 1
                 
                 self.phase_results['data_preparation'] = {
                     'status': 'completed',
@@ -334,8 +523,8 @@ class ComprehensiveBacktestRunner:
                     'manual_download': True
                 }
             
-            phase_duration = time.time() - phase_start
-            logger.info(f"⏱️  Phase 1 completed in {phase_duration:.1f} seconds")
+            self._mark_phase_completed('data_preparation')
+            self._record_phase_timing('data_preparation', phase_start)
             
         except Exception as e:
             self.phase_results['data_preparation'] = {
@@ -350,7 +539,7 @@ class ComprehensiveBacktestRunner:
         logger.info("📊 PHASE 2: MARKET CYCLE ANALYSIS")
         logger.info("-" * 60)
         
-        phase_start = time.time()
+        phase_start = time.perf_counter_ns()
         
         try:
             if COMPREHENSIVE_BACKTESTER_AVAILABLE:
@@ -365,8 +554,10 @@ class ComprehensiveBacktestRunner:
                 }
                 
                 # Log cycle information
-                for cycle_name, cycle_info in cycle_periods.items():
-                    logger.info(f"   {cycle_info['description']}: {cycle_info['start'].date()} to {cycle_info['end'].date()}")
+                logger.info("%s", "\n".join(
+                    f"   {cycle_info['description']}: {cycle_info['start'].date()} to {cycle_info['end'].date()}"
+                    for cycle_info in cycle_periods.values()
+                ))
                 
             else:
                 # Basic market analysis
@@ -381,8 +572,8 @@ class ComprehensiveBacktestRunner:
                 'analysis': market_analysis
             }
             
-            phase_duration = time.time() - phase_start
-            logger.info(f"⏱️  Phase 2 completed in {phase_duration:.1f} seconds")
+            self._mark_phase_completed('market_analysis')
+            self._record_phase_timing('market_analysis', phase_start)
             
         except Exception as e:
             self.phase_results['market_analysis'] = {
@@ -397,15 +588,16 @@ class ComprehensiveBacktestRunner:
         logger.info("🏦 PHASE 3: INSTITUTIONAL BOT TESTING")
         logger.info("-" * 60)
         
-        phase_start = time.time()
+        phase_start = time.perf_counter_ns()
         
         try:
             if INSTITUTIONAL_BACKTESTER_AVAILABLE:
                 # Create institutional bot backtester
                 institutional_config = {
                     'output_directory': os.path.join(self.output_dir, 'institutional'),
-                    'risk_scenarios': self.config.get('risk_scenarios', ['conservative', 'moderate', 'aggressive']),
-                    'capital_scenarios': self.config['capital_scenarios']
+                    'risk_scenarios': list(self._risk_scenarios),
+                    'capital_scenarios': self.config['capital_scenarios'],
+                    'scenario_workers': self.config.get('scenario_workers')
                 }
                 
                 institutional_backtester = InstitutionalBotBacktester(institutional_config)
@@ -429,9 +621,9 @@ class ComprehensiveBacktestRunner:
                 analysis = institutional_results.get('comprehensive_analysis', {})
                 summary = analysis.get('summary', {})
                 
-                logger.info(f"   Average Return: {summary.get('avg_return', 0):.2%}")
-                logger.info(f"   Average Sharpe Ratio: {summary.get('avg_sharpe', 0):.2f}")
-                logger.info(f"   Scenarios Tested: {summary.get('scenarios_tested', 0)}")
+                logger.info("   Average Return: %.2f%%", summary.get('avg_return', 0) * 100)
+                logger.info("   Average Sharpe Ratio: %.2f", summary.get('avg_sharpe', 0))
+                logger.info("   Scenarios Tested: %s", summary.get('scenarios_tested', 0))
                 
             else:
                 # Mock institutional testing
@@ -451,8 +643,8 @@ class ComprehensiveBacktestRunner:
                     'scenarios_tested': len(mock_results)
                 }
             
-            phase_duration = time.time() - phase_start
-            logger.info(f"⏱️  Phase 3 completed in {phase_duration:.1f} seconds")
+            self._mark_phase_completed('institutional_testing')
+            self._record_phase_timing('institutional_testing', phase_start)
             
         except Exception as e:
             self.phase_results['institutional_testing'] = {
@@ -467,17 +659,11 @@ class ComprehensiveBacktestRunner:
         logger.info("🔍 PHASE 4: COMPREHENSIVE ANALYSIS")
         logger.info("-" * 60)
         
-        phase_start = time.time()
+        phase_start = time.perf_counter_ns()
         
         try:
             # Combine results from all phases
-            comprehensive_analysis = {
-                'data_quality': self._analyze_data_quality(),
-                'market_conditions': self._analyze_market_conditions(),
-                'strategy_performance': self._analyze_strategy_performance(),
-                'risk_assessment': self._analyze_risk_metrics(),
-                'comparative_analysis': self._perform_comparative_analysis()
-            }
+            comprehensive_analysis = self._build_comprehensive_analysis()
             
             self.phase_results['comprehensive_analysis'] = {
                 'status': 'completed',
@@ -486,12 +672,12 @@ class ComprehensiveBacktestRunner:
             
             # Log key insights
             logger.info("   Key Analysis Insights:")
-            logger.info(f"   - Data Quality Score: {comprehensive_analysis['data_quality'].get('score', 'N/A')}")
-            logger.info(f"   - Market Conditions: {comprehensive_analysis['market_conditions'].get('overall_assessment', 'N/A')}")
-            logger.info(f"   - Strategy Effectiveness: {comprehensive_analysis['strategy_performance'].get('overall_rating', 'N/A')}")
+            logger.info("   - Data Quality Score: %s", comprehensive_analysis['data_quality'].get('score', 'N/A'))
+            logger.info("   - Market Conditions: %s", comprehensive_analysis['market_conditions'].get('overall_assessment', 'N/A'))
+            logger.info("   - Strategy Effectiveness: %s", comprehensive_analysis['strategy_performance'].get('overall_rating', 'N/A'))
             
-            phase_duration = time.time() - phase_start
-            logger.info(f"⏱️  Phase 4 completed in {phase_duration:.1f} seconds")
+            self._mark_phase_completed('comprehensive_analysis')
+            self._record_phase_timing('comprehensive_analysis', phase_start)
             
         except Exception as e:
             self.phase_results['comprehensive_analysis'] = {
@@ -506,31 +692,25 @@ class ComprehensiveBacktestRunner:
         logger.info("📋 PHASE 5: REPORT GENERATION")
         logger.info("-" * 60)
         
-        phase_start = time.time()
+        phase_start = time.perf_counter_ns()
         
         try:
-            # Generate multiple report formats
-            reports_generated = []
-            
-            # 1. Executive Summary Report
-            exec_summary_path = await self._generate_executive_summary()
-            reports_generated.append(('Executive Summary', exec_summary_path))
-            
-            # 2. Technical Analysis Report
-            tech_analysis_path = await self._generate_technical_report()
-            reports_generated.append(('Technical Analysis', tech_analysis_path))
-            
-            # 3. Risk Assessment Report
-            risk_report_path = await self._generate_risk_report()
-            reports_generated.append(('Risk Assessment', risk_report_path))
-            
-            # 4. Performance Comparison Report
-            performance_path = await self._generate_performance_report()
-            reports_generated.append(('Performance Comparison', performance_path))
+            # Phase 4's analysis feeds the reports directly
+            analysis = self._get_comprehensive_analysis()
             
-            # 5. Master Dashboard
-            dashboard_path = await self._generate_master_dashboard()
-            reports_generated.append(('Master Dashboard', dashboard_path))
+            # Render every report in memory, then write them all in one batch off the event loop
+            rendered = [
+                ('Executive Summary', self._generate_executive_summary(analysis)),
+                ('Technical Analysis', self._generate_technical_report()),
+                ('Risk Assessment', self._generate_risk_report()),
+                ('Performance Comparison', self._generate_performance_report()),
+                ('Master Dashboard', self._generate_master_dashboard())
+            ]
+            await asyncio.to_thread(
+                _write_reports,
+                [report for _, report in rendered] + [(os.path.join(self.output_dir, 'master.css'), _DASHBOARD_CSS)]
+            )
+            reports_generated = [(report_name, file_path) for report_name, (file_path, _) in rendered]
             
             self.phase_results['report_generation'] = {
                 'status': 'completed',
@@ -538,12 +718,12 @@ class ComprehensiveBacktestRunner:
                 'output_directory': self.output_dir
             }
             
-            logger.info(f"   Generated {len(reports_generated)} comprehensive reports")
-            for report_name, report_path in reports_generated:
-                logger.info(f"   - {report_name}: {report_path}")
+            logger.info("   Generated %d comprehensive reports\n%s", len(reports_generated), "\n".join(
+                f"   - {report_name}: {report_path}" for report_name, report_path in reports_generated
+            ))
             
-            phase_duration = time.time() - phase_start
-            logger.info(f"⏱️  Phase 5 completed in {phase_duration:.1f} seconds")
+            self._mark_phase_completed('report_generation')
+            self._record_phase_timing('report_generation', phase_start)
             
         except Exception as e:
             self.phase_results['report_generation'] = {
@@ -553,60 +733,93 @@ class ComprehensiveBacktestRunner:
             logger.error(f"Phase 5 failed: {e}")
             raise
     
-    def _phase_6_final_summary(self):
+    def _phase_completed(self, phase_name: str) -> bool:
+        """Whether a phase finished successfully."""
+        return bool(self._completed_mask & _PHASE_BITS[phase_name])
+    
+    def _mark_phase_completed(self, phase_name: str):
+        """Record a phase's successful completion."""
+        self._completed_mask |= _PHASE_BITS[phase_name]
+    
+    def _completed_phase_count(self) -> int:
+        """Number of phases that finished successfully."""
+        return bin(self._completed_mask).count('1')
+    
+    def _record_phase_timing(self, phase_name: str, phase_start_ns: int):
+        """Record a phase's elapsed time (from a perf_counter_ns start) in milliseconds."""
+        self.phase_timings.append((phase_name, (time.perf_counter_ns() - phase_start_ns) / 1e6))
+    
+    async def _phase_6_final_summary(self):
         """Phase 6: Final summary and conclusions."""
         logger.info("📊 PHASE 6: FINAL SUMMARY")
         logger.info("-" * 60)
         
         # Calculate total execution time
-        total_duration = (datetime.now() - self.start_time).total_seconds()
+        end_time = datetime.now()
+        total_duration = time.perf_counter() - self._run_t0
         
         # Compile final results
         self.final_results = {
             'execution_summary': {
                 'start_time': self.start_time.isoformat(),
-                'end_time': datetime.now().isoformat(),
+                'end_time': end_time.isoformat(),
                 'total_duration_seconds': total_duration,
-                'duration_formatted': f"{total_duration // 60:.0f}m {total_duration % 60:.0f}s"
+                'duration_formatted': f"{total_duration // 60:.0f}m {total_duration % 60:.0f}s",
+                'phase_timings_ms': dict(self.phase_timings)
             },
             'phase_results': self.phase_results,
             'configuration': self.config,
             'success_rate': self._calculate_success_rate(),
-            'key_findings': self._extract_key_findings(),
+            'phases_completed': self._completed_phase_count(),
+            'key_findings': self._extract_key_findings(self._get_comprehensive_analysis()),
             'recommendations': self._generate_recommendations()
         }
         
         # Save final results
         results_file = os.path.join(self.output_dir, 'final_results.json')
-        with open(results_file, 'w') as f:
-            json.dump(self.final_results, f, indent=2, default=str)
+        await asyncio.to_thread(dump_json, results_file, self.final_results)
         
         # Display summary
         logger.info("✅ COMPREHENSIVE BACKTEST SUITE SUMMARY:")
-        logger.info(f"   Total Execution Time: {self.final_results['execution_summary']['duration_formatted']}")
-        logger.info(f"   Success Rate: {self.final_results['success_rate']:.1%}")
-        logger.info(f"   Phases Completed: {sum(1 for p in self.phase_results.values() if p.get('status') == 'completed')}/6")
-        logger.info(f"   Output Directory: {self.output_dir}")
+        logger.info("   Total Execution Time: %s", self.final_results['execution_summary']['duration_formatted'])
+        logger.info("   Success Rate: %.1f%%", self.final_results['success_rate'] * 100)
+        logger.info("   Phases Completed: %d/6", self._completed_phase_count())
+        logger.info("   Output Directory: %s", self.output_dir)
+        logger.info("   Phase Timings: %s", ", ".join(f"{name} {ms:.1f}ms" for name, ms in self.phase_timings))
         
-        # Key findings
-        logger.info("\n🎯 KEY FINDINGS:")
-        for finding in self.final_results['key_findings']:
-            logger.info(f"   • {finding}")
-        
-        # Recommendations
-        logger.info("\n💡 RECOMMENDATIONS:")
-        for recommendation in self.final_results['recommendations']:
-            logger.info(f"   • {recommendation}")
+        # Key findings and recommendations (one record each)
+        logger.info("\n🎯 KEY FINDINGS:\n%s", "\n".join(
+            f"   • {finding}" for finding in self.final_results['key_findings']
+        ))
+        logger.info("\n💡 RECOMMENDATIONS:\n%s", "\n".join(
+            f"   • {recommendation}" for recommendation in self.final_results['recommendations']
+        ))
     
     # Helper methods for analysis
+    def _build_comprehensive_analysis(self) -> Dict[str, Any]:
+        """Run every analysis helper over the current phase results."""
+        return {
+            'data_quality': self._analyze_data_quality(),
+            'market_conditions': self._analyze_market_conditions(),
+            'strategy_performance': self._analyze_strategy_performance(),
+            'risk_assessment': self._analyze_risk_metrics(),
+            'comparative_analysis': self._perform_comparative_analysis()
+        }
+    
+    def _get_comprehensive_analysis(self) -> Dict[str, Any]:
+        """Phase 4's stored analysis, or a fresh one if Phase 4 has not completed."""
+        if self._phase_completed('comprehensive_analysis'):
+            return self.phase_results['comprehensive_analysis']['analysis']
+        return self._build_comprehensive_analysis()
+    
     def _analyze_data_quality(self) -> Dict[str, Any]:
         """Analyze data quality metrics."""
         data_prep = self.phase_results.get('data_preparation', {})
         
-        if data_prep.get('status') == 'completed':
+        if self._phase_completed('data_preparation'):
             data_files = data_prep.get('data_files', 0)
             symbols_requested = len(self.config['symbols'])
-            timeframes = len(self.config.get('timeframes', ['1h']))
+            timeframes = len(self._timeframes)
             expected_files = symbols_requested * timeframes
             
             completion_rate = data_files / expected_files if expected_files > 0 else 0
@@ -628,7 +841,7 @@ class ComprehensiveBacktestRunner:
         """Analyze market conditions during test period."""
         market_analysis = self.phase_results.get('market_analysis', {})
         
-        if market_analysis.get('status') == 'completed':
+        if self._phase_completed('market_analysis'):
             analysis = market_analysis.get('analysis', {})
             cycles = analysis.get('total_cycles', 0)
             
@@ -648,7 +861,7 @@ class ComprehensiveBacktestRunner:
         """Analyze overall strategy performance."""
         institutional = self.phase_results.get('institutional_testing', {})
         
-        if institutional.get('status') == 'completed':
+        if self._phase_completed('institutional_testing'):
             results = institutional.get('results', {})
             
             if isinstance(results, dict) and 'comprehensive_analysis' in results:
@@ -673,7 +886,7 @@ class ComprehensiveBacktestRunner:
             else:
                 # Mock results analysis
                 mock_returns = [r.get('total_return', 0) for r in results.values() if isinstance(r, dict)]
-                avg_return = sum(mock_returns) / len(mock_returns) if mock_returns else 0
+                avg_return = statistics.fmean(mock_returns) if mock_returns else 0
                 
                 return {
                     'overall_rating': 'Good' if avg_return > 0.15 else 'Fair',
@@ -689,9 +902,7 @@ class ComprehensiveBacktestRunner:
     
     def _analyze_risk_metrics(self) -> Dict[str, Any]:
         """Analyze risk management effectiveness."""
-        institutional = self.phase_results.get('institutional_testing', {})
-        
-        if institutional.get('status') == 'completed':
+        if self._phase_completed('institutional_testing'):
             return {
                 'risk_management': 'Advanced',
                 'drawdown_control': 'Effective',
@@ -716,29 +927,24 @@ class ComprehensiveBacktestRunner:
     
     def _calculate_success_rate(self) -> float:
         """Calculate overall success rate of backtest suite."""
-        completed_phases = sum(1 for p in self.phase_results.values() if p.get('status') == 'completed')
         total_phases = len(self.phase_results)
-        return completed_phases / total_phases if total_phases > 0 else 0
+        return self._completed_phase_count() / total_phases if total_phases > 0 else 0
     
-    def _extract_key_findings(self) -> List[str]:
-        """Extract key findings from all phases."""
+    def _extract_key_findings(self, analysis: Dict[str, Any]) -> List[str]:
+        """Extract key findings from the comprehensive analysis."""
         findings = []
         
         # Data quality findings
-        data_analysis = self._analyze_data_quality()
-        findings.append(f"Data Quality: {data_analysis.get('assessment', 'Unknown')}")
+        findings.append(f"Data Quality: {analysis['data_quality'].get('assessment', 'Unknown')}")
         
         # Strategy performance findings
-        strategy_analysis = self._analyze_strategy_performance()
-        findings.append(f"Strategy Performance: {strategy_analysis.get('assessment', 'Unknown')}")
+        findings.append(f"Strategy Performance: {analysis['strategy_performance'].get('assessment', 'Unknown')}")
         
         # Risk management findings
-        risk_analysis = self._analyze_risk_metrics()
-        findings.append(f"Risk Management: {risk_analysis.get('assessment', 'Unknown')}")
+        findings.append(f"Risk Management: {analysis['risk_assessment'].get('assessment', 'Unknown')}")
         
         # Market condition findings
-        market_analysis = self._analyze_market_conditions()
-        findings.append(f"Market Coverage: {market_analysis.get('period_analysis', 'Unknown')}")
+        findings.append(f"Market Coverage: {analysis['market_conditions'].get('period_analysis', 'Unknown')}")
         
         return findings
     
@@ -759,8 +965,7 @@ class ComprehensiveBacktestRunner:
             recommendations.append("Conduct additional testing and development")
         
         # Strategy-specific recommendations
-        institutional = self.phase_results.get('institutional_testing', {})
-        if institutional.get('status') == 'completed':
+        if self._phase_completed('institutional_testing'):
             recommendations.append("Institutional modules demonstrate strong performance")
             recommendations.append("Cross-exchange arbitrage shows consistent profit potential")
         
@@ -770,211 +975,62 @@ class ComprehensiveBacktestRunner:
         return recommendations
     
     # Report generation methods
-    async def _generate_executive_summary(self) -> str:
-        """Generate executive summary report."""
+    def _generate_executive_summary(self, analysis: Dict[str, Any]) -> Tuple[str, str]:
+        """Render the executive summary report as (path, html)."""
         file_path = os.path.join(self.output_dir, 'executive_summary.html')
         
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Executive Summary - Comprehensive Backtest</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                .header {{ text-align: center; color: #333; }}
-                .summary-card {{ border: 1px solid #ddd; padding: 20px; margin: 20px 0; border-radius: 5px; }}
-                .metric {{ display: inline-block; margin: 10px 20px; }}
-                .metric-value {{ font-size: 24px; font-weight: bold; color: #007bff; }}
-                .metric-label {{ color: #666; font-size: 14px; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>🚀 Executive Summary</h1>
-                <h2>Comprehensive Backtesting Results 2021-2025</h2>
-            </div>
-            
-            <div class="summary-card">
-                <h3>📊 Execution Overview</h3>
-                <div class="metric">
-                    <div class="metric-value">{self._calculate_success_rate():.1%}</div>
-                    <div class="metric-label">Success Rate</div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value">{len(self.phase_results)}</div>
-                    <div class="metric-label">Phases Executed</div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value">{len(self.config['symbols'])}</div>
-                    <div class="metric-label">Trading Pairs</div>
-                </div>
-                <div class="metric">
-                    <div class="metric-value">4</div>
-                    <div class="metric-label">Market Cycles</div>
-                </div>
-            </div>
-            
-            <div class="summary-card">
-                <h3>🎯 Key Findings</h3>
-                <ul>
-        """
-        
-        for finding in self._extract_key_findings():
-            html_content += f"<li>{finding}</li>"
+        html_content = _EXECUTIVE_SUMMARY_TEMPLATE.substitute(
+            success_rate=f"{self._calculate_success_rate():.1%}",
+            phases_executed=len(self.phase_results),
+            trading_pairs=len(self.config['symbols']),
+            findings="".join(f"<li>{html.escape(finding)}</li>" for finding in self._extract_key_findings(analysis)),
+            recommendations="".join(
+                f"<li>{html.escape(recommendation)}</li>" for recommendation in self._generate_recommendations()
+            )
+        )
         
-        html_content += f"""
-                </ul>
-            </div>
-            
-            <div class="summary-card">
-                <h3>💡 Recommendations</h3>
-                <ul>
-        """
-        
-        for recommendation in self._generate_recommendations():
-            html_content += f"<li>{recommendation}</li>"
-        
-        html_content += """
-                </ul>
-            </div>
-        </body>
-        </html>
-        """
-        
-        with open(file_path, 'w') as f:
-            f.write(html_content)
-        
-        return file_path
+        return file_path, html_content
     
-    async def _generate_technical_report(self) -> str:
-        """Generate technical analysis report."""
+    def _generate_technical_report(self) -> Tuple[str, bytes]:
+        """Render the technical analysis report as (path, html)."""
         file_path = os.path.join(self.output_dir, 'technical_report.html')
         
         # Simplified technical report
-        with open(file_path, 'w') as f:
-            f.write("""
-            <!DOCTYPE html>
-            <html>
-            <head><title>Technical Analysis Report</title></head>
-            <body>
-                <h1>Technical Analysis Report</h1>
-                <p>Detailed technical analysis of backtesting results.</p>
-                <p>This report contains in-depth analysis of strategy performance, risk metrics, and technical indicators.</p>
-            </body>
-            </html>
-            """)
-        
-        return file_path
+        return file_path, _TECHNICAL_REPORT_HTML
     
-    async def _generate_risk_report(self) -> str:
-        """Generate risk assessment report."""
+    def _generate_risk_report(self) -> Tuple[str, bytes]:
+        """Render the risk assessment report as (path, html)."""
         file_path = os.path.join(self.output_dir, 'risk_assessment.html')
         
-        with open(file_path, 'w') as f:
-            f.write("""
-            <!DOCTYPE html>
-            <html>
-            <head><title>Risk Assessment Report</title></head>
-            <body>
-                <h1>Risk Assessment Report</h1>
-                <p>Comprehensive risk analysis and management evaluation.</p>
-            </body>
-            </html>
-            """)
-        
-        return file_path
+        return file_path, _RISK_REPORT_HTML
     
-    async def _generate_performance_report(self) -> str:
-        """Generate performance comparison report."""
+    def _generate_performance_report(self) -> Tuple[str, bytes]:
+        """Render the performance comparison report as (path, html)."""
         file_path = os.path.join(self.output_dir, 'performance_comparison.html')
         
-        with open(file_path, 'w') as f:
-            f.write("""
-            <!DOCTYPE html>
-            <html>
-            <head><title>Performance Comparison Report</title></head>
-            <body>
-                <h1>Performance Comparison Report</h1>
-                <p>Comparative analysis of strategy performance across different scenarios.</p>
-            </body>
-            </html>
-            """)
-        
-        return file_path
+        return file_path, _PERFORMANCE_REPORT_HTML
     
-    async def _generate_master_dashboard(self) -> str:
-        """Generate master dashboard."""
+    def _generate_master_dashboard(self) -> Tuple[str, Tuple[bytes, str, bytes]]:
+        """Render the master dashboard as (path, html fragments)."""
         file_path = os.path.join(self.output_dir, 'master_dashboard.html')
         
-        with open(file_path, 'w') as f:
-            f.write(f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Master Dashboard - Comprehensive Backtest</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                    .dashboard {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; }}
-                    .card {{ border: 1px solid #ddd; padding: 20px; border-radius: 8px; }}
-                    .header {{ text-align: center; color: #333; margin-bottom: 30px; }}
-                    .success {{ color: green; }}
-                    .warning {{ color: orange; }}
-                    .error {{ color: red; }}
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>🚀 Master Dashboard</h1>
-                    <h2>Comprehensive Backtesting Suite Results</h2>
-                    <p>Period: {self.config['start_date'].date()} to {self.config['end_date'].date()}</p>
-                </div>
-                
-                <div class="dashboard">
-                    <div class="card">
-                        <h3>📊 Execution Summary</h3>
-                        <p><strong>Success Rate:</strong> <span class="success">{self._calculate_success_rate():.1%}</span></p>
-                        <p><strong>Duration:</strong> {((datetime.now() - self.start_time).total_seconds() // 60):.0f} minutes</p>
-                        <p><strong>Symbols Tested:</strong> {len(self.config['symbols'])}</p>
-                        <p><strong>Capital Scenarios:</strong> {len(self.config['capital_scenarios'])}</p>
-                    </div>
-                    
-                    <div class="card">
-                        <h3>🏦 Institutional Bot</h3>
-                        <p><strong>Status:</strong> {self.phase_results.get('institutional_testing', {}).get('status', 'Unknown')}</p>
-                        <p><strong>Modules Tested:</strong> 8</p>
-                        <p><strong>Scenarios:</strong> {self.phase_results.get('institutional_testing', {}).get('scenarios_tested', 'N/A')}</p>
-                    </div>
-                    
-                    <div class="card">
-                        <h3>📥 Data Quality</h3>
-                        <p><strong>Status:</strong> {self.phase_results.get('data_preparation', {}).get('status', 'Unknown')}</p>
-                        <p><strong>Files Downloaded:</strong> {self.phase_results.get('data_preparation', {}).get('data_files', 'N/A')}</p>
-                        <p><strong>Coverage:</strong> Full cycle 2021-2025</p>
-                    </div>
-                    
-                    <div class="card">
-                        <h3>📋 Reports Generated</h3>
-                        <p><strong>Executive Summary:</strong> ✅</p>
-                        <p><strong>Technical Analysis:</strong> ✅</p>
-                        <p><strong>Risk Assessment:</strong> ✅</p>
-                        <p><strong>Performance Comparison:</strong> ✅</p>
-                    </div>
-                </div>
-                
-                <div style="margin-top: 40px; text-align: center;">
-                    <h3>🔗 Quick Links</h3>
-                    <p>
-                        <a href="executive_summary.html">Executive Summary</a> | 
-                        <a href="technical_report.html">Technical Report</a> | 
-                        <a href="risk_assessment.html">Risk Assessment</a> | 
-                        <a href="performance_comparison.html">Performance Report</a>
-                    </p>
-                </div>
-            </body>
-            </html>
-            """)
+        institutional = self.phase_results.get('institutional_testing', {})
+        data_prep = self.phase_results.get('data_preparation', {})
         
-        return file_path
+        body = _DASHBOARD_BODY_TEMPLATE.substitute(
+            start_date=self.config['start_date'].date(),
+            end_date=self.config['end_date'].date(),
+            success_rate=f"{self._calculate_success_rate():.1%}",
+            duration_minutes=f"{(time.perf_counter() - self._run_t0) // 60:.0f}",
+            symbols_tested=len(self.config['symbols']),
+            capital_scenarios=len(self.config['capital_scenarios']),
+            institutional_status=institutional.get('status', 'Unknown'),
+            institutional_scenarios=institutional.get('scenarios_tested', 'N/A'),
+            data_status=data_prep.get('status', 'Unknown'),
+            data_files=data_prep.get('data_files', 'N/A')
+        )
+        
+        return file_path, (_DASHBOARD_HEAD, body, _DASHBOARD_FOOT)
 
 # ============================================================================
 # COMMAND LINE INTERFACE
@@ -988,14 +1044,14 @@ def parse_arguments():
     
     parser.add_argument(
         '--start-date', 
-        type=str, 
+        type=datetime.fromisoformat, 
         default='2021-01-01',
         help='Start date for backtesting (YYYY-MM-DD)'
     )
     
     parser.add_argument(
         '--end-date', 
-        type=str, 
+        type=datetime.fromisoformat, 
         default='2025-01-01',
         help='End date for backtesting (YYYY-MM-DD)'
     )
@@ -1029,6 +1085,13 @@ def parse_arguments():
         help='Output directory for results'
     )
     
+    parser.add_argument(
+        '--scenario-workers', 
+        type=int, 
+        default=None,
+        help='Worker processes for institutional scenarios (default: 1, run in-process)'
+    )
+    
     parser.add_argument(
         '--quick-test', 
         action='store_true',
@@ -1053,21 +1116,22 @@ async def main():
         # Adjust configuration for quick test
         if args.quick_test:
             print("⚡ Running in QUICK TEST mode")
-            args.start_date = '2024-01-01'
-            args.end_date = '2024-03-01'
+            args.start_date = datetime(2024, 1, 1)
+            args.end_date = datetime(2024, 3, 1)
             args.symbols = ['BTCUSDT']
             args.capital = [10000]
             args.timeframes = ['1h']
         
         # Create configuration
         config = {
-            'start_date': datetime.strptime(args.start_date, '%Y-%m-%d'),
-            'end_date': datetime.strptime(args.end_date, '%Y-%m-%d'),
+            'start_date': args.start_date,
+            'end_date': args.end_date,
             'symbols': args.symbols,
             'capital_scenarios': args.capital,
             'timeframes': args.timeframes,
             'risk_scenarios': ['conservative', 'moderate', 'aggressive'],
-            'output_directory': args.output_dir
+            'output_directory': args.output_dir,
+            'scenario_workers': args.scenario_workers
         }
         
         print(f"\n📊 Configuration:")
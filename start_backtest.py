@@ -45,70 +45,78 @@ def print_banner():
 ===============================================================================
     """)
 
+# Preset configurations, built once at import. Callers that modify a preset
+# take a shallow copy; nested lists are only ever replaced, not mutated.
+_PRESETS = {
+    'quick': {
+        'description': 'Quick test with 2 months of recent data',
+        'start_date': '2024-10-01',
+        'end_date': '2024-12-01',
+        'symbols': ['BTCUSDT'],
+        'capital_scenarios': [10000],
+        'timeframes': ['1h'],
+        'risk_scenarios': ['moderate']
+    },
+    'demo': {
+        'description': 'Demo with 6 months of data',
+        'start_date': '2024-06-01',
+        'end_date': '2024-12-01',
+        'symbols': ['BTCUSDT', 'ETHUSDT'],
+        'capital_scenarios': [10000, 50000],
+        'timeframes': ['1h', '4h'],
+        'risk_scenarios': ['conservative', 'moderate']
+    },
+    'full': {
+        'description': 'Complete 2021-2025 analysis',
+        'start_date': '2021-01-01',
+        'end_date': '2025-01-01',
+        'symbols': ['BTCUSDT', 'ETHUSDT', 'BNBUSDT'],
+        'capital_scenarios': [10000, 50000, 100000],
+        'timeframes': ['1h', '4h', '1d'],
+        'risk_scenarios': ['conservative', 'moderate', 'aggressive']
+    },
+    'bull_2021': {
+        'description': '2021 Bull Market Analysis',
+        'start_date': '2021-01-01',
+        'end_date': '2021-11-30',
+        'symbols': ['BTCUSDT', 'ETHUSDT'],
+        'capital_scenarios': [50000, 100000],
+        'timeframes': ['1h', '4h'],
+        'risk_scenarios': ['moderate', 'aggressive']
+    },
+    'bear_2022': {
+        'description': '2022 Bear Market Analysis',
+        'start_date': '2022-01-01',
+        'end_date': '2022-12-31',
+        'symbols': ['BTCUSDT', 'ETHUSDT'],
+        'capital_scenarios': [50000, 100000],
+        'timeframes': ['1h', '4h'],
+        'risk_scenarios': ['conservative', 'moderate']
+    },
+    'recovery_2023': {
+        'description': '2023 Recovery Analysis',
+        'start_date': '2023-01-01',
+        'end_date': '2023-12-31',
+        'symbols': ['BTCUSDT', 'ETHUSDT'],
+        'capital_scenarios': [50000, 100000],
+        'timeframes': ['1h', '4h'],
+        'risk_scenarios': ['moderate']
+    }
+}
+
+# Configuration used when no preset flag is given
+_DEFAULT_CONFIG = {
+    'start_date': '2024-01-01',
+    'end_date': '2024-06-01',
+    'symbols': ['BTCUSDT'],
+    'capital_scenarios': [10000],
+    'timeframes': ['1h'],
+    'risk_scenarios': ['moderate']
+}
+
 def get_preset_configs():
     """Get preset configurations."""
-    return {
-        'quick': {
-            'description': 'Quick test with 2 months of recent data',
-            'start_date': '2024-10-01',
-            'end_date': '2024-12-01',
-            'symbols': ['BTCUSDT'],
-            'capital': [10000],
-            'capital_scenarios': [10000],
-            'timeframes': ['1h'],
-            'risk_scenarios': ['moderate']
-        },
-        'demo': {
-            'description': 'Demo with 6 months of data',
-            'start_date': '2024-06-01',
-            'end_date': '2024-12-01',
-            'symbols': ['BTCUSDT', 'ETHUSDT'],
-            'capital': [10000, 50000],
-            'capital_scenarios': [10000, 50000],
-            'timeframes': ['1h', '4h'],
-            'risk_scenarios': ['conservative', 'moderate']
-        },
-        'full': {
-            'description': 'Complete 2021-2025 analysis',
-            'start_date': '2021-01-01',
-            'end_date': '2025-01-01',
-            'symbols': ['BTCUSDT', 'ETHUSDT', 'BNBUSDT'],
-            'capital': [10000, 50000, 100000],
-            'capital_scenarios': [10000, 50000, 100000],
-            'timeframes': ['1h', '4h', '1d'],
-            'risk_scenarios': ['conservative', 'moderate', 'aggressive']
-        },
-        'bull_2021': {
-            'description': '2021 Bull Market Analysis',
-            'start_date': '2021-01-01',
-            'end_date': '2021-11-30',
-            'symbols': ['BTCUSDT', 'ETHUSDT'],
-            'capital': [50000, 100000],
-            'capital_scenarios': [50000, 100000],
-            'timeframes': ['1h', '4h'],
-            'risk_scenarios': ['moderate', 'aggressive']
-        },
-        'bear_2022': {
-            'description': '2022 Bear Market Analysis',
-            'start_date': '2022-01-01',
-            'end_date': '2022-12-31',
-            'symbols': ['BTCUSDT', 'ETHUSDT'],
-            'capital': [50000, 100000],
-            'capital_scenarios': [50000, 100000],
-            'timeframes': ['1h', '4h'],
-            'risk_scenarios': ['conservative', 'moderate']
-        },
-        'recovery_2023': {
-            'description': '2023 Recovery Analysis',
-            'start_date': '2023-01-01',
-            'end_date': '2023-12-31',
-            'symbols': ['BTCUSDT', 'ETHUSDT'],
-            'capital': [50000, 100000],
-            'capital_scenarios': [50000, 100000],
-            'timeframes': ['1h', '4h'],
-            'risk_scenarios': ['moderate']
-        }
-    }
+    return _PRESETS
 
 async def run_backtest_with_config(config):
     """Run backtest with given configuration."""
@@ -164,14 +172,16 @@ Custom Examples:
     preset_group.add_argument('--recovery-2023', action='store_true', help='2023 recovery')
     
     # Custom configuration
-    parser.add_argument('--start', type=str, help='Start date (YYYY-MM-DD)')
-    parser.add_argument('--end', type=str, help='End date (YYYY-MM-DD)')
+    parser.add_argument('--start', type=datetime.fromisoformat, help='Start date (YYYY-MM-DD)')
+    parser.add_argument('--end', type=datetime.fromisoformat, help='End date (YYYY-MM-DD)')
     parser.add_argument('--symbols', nargs='+', help='Trading symbols')
     parser.add_argument('--capital', nargs='+', type=float, help='Capital amounts')
     parser.add_argument('--timeframes', nargs='+', help='Timeframes (1h, 4h, 1d)')
     parser.add_argument('--risk', nargs='+', choices=['conservative', 'moderate', 'aggressive'], 
                        help='Risk scenarios')
     parser.add_argument('--output', type=str, help='Output directory')
+    parser.add_argument('--scenario-workers', type=int,
+                       help='Worker processes for institutional scenarios (default: 1, run in-process)')
     
     # Additional options
     parser.add_argument('--list-presets', action='store_true', help='List available presets')
@@ -181,57 +191,25 @@ Custom Examples:
 
 def build_config_from_args(args):
     """Build configuration from command line arguments."""
-    presets = get_preset_configs()
+    # Preset flags share their preset's key as argparse dest (--bull-2021 -> bull_2021)
+    preset = next((key for key in _PRESETS if getattr(args, key, False)), None)
+    config = {**(_PRESETS[preset] if preset else _DEFAULT_CONFIG)}
     
-    # Check for preset configuration
-    config = None
-    if args.quick:
-        config = presets['quick'].copy()
-    elif args.demo:
-        config = presets['demo'].copy()
-    elif args.full:
-        config = presets['full'].copy()
-    elif args.bull_2021:
-        config = presets['bull_2021'].copy()
-    elif args.bear_2022:
-        config = presets['bear_2022'].copy()
-    elif args.recovery_2023:
-        config = presets['recovery_2023'].copy()
-    else:
-        # Default configuration
-        config = {
-            'start_date': '2024-01-01',
-            'end_date': '2024-06-01',
-            'symbols': ['BTCUSDT'],
-            'capital': [10000],
-            'capital_scenarios': [10000],
-            'timeframes': ['1h'],
-            'risk_scenarios': ['moderate']
-        }
-    
-    # Override with custom arguments
-    if args.start:
-        config['start_date'] = args.start
-    if args.end:
-        config['end_date'] = args.end
+    # Override with custom arguments (--start/--end arrive as datetimes from argparse)
     if args.symbols:
         config['symbols'] = args.symbols
     if args.capital:
-        config['capital'] = args.capital
+        config['capital_scenarios'] = args.capital
     if args.timeframes:
         config['timeframes'] = args.timeframes
     if args.risk:
         config['risk_scenarios'] = args.risk
+    if args.scenario_workers:
+        config['scenario_workers'] = args.scenario_workers
     
-    # Ensure capital_scenarios is set (run_comprehensive_backtest expects this field)
-    if 'capital' in config:
-        config['capital_scenarios'] = config['capital']
-    elif 'capital_scenarios' not in config:
-        config['capital_scenarios'] = config.get('capital', [10000])
-    
-    # Convert date strings to datetime objects
-    config['start_date'] = datetime.strptime(config['start_date'], '%Y-%m-%d')
-    config['end_date'] = datetime.strptime(config['end_date'], '%Y-%m-%d')
+    # Convert preset date strings to datetime objects unless overridden
+    config['start_date'] = args.start or datetime.fromisoformat(config['start_date'])
+    config['end_date'] = args.end or datetime.fromisoformat(config['end_date'])
     
     # Set output directory
     if args.output:
@@ -247,25 +225,14 @@ def build_config_from_args(args):
 
 def display_config(config):
     """Display configuration summary."""
-    print("📊 BACKTEST CONFIGURATION:")
-    print("-" * 50)
-    print(f"   📅 Period: {config['start_date'].date()} to {config['end_date'].date()}")
-    print(f"   💰 Symbols: {', '.join(config['symbols'])}")
-    print(f"   💵 Capital: {', '.join(f'${c:,.0f}' for c in config['capital'])}")
-    print(f"   🕒 Timeframes: {', '.join(config['timeframes'])}")
-    print(f"   ⚠️  Risk Scenarios: {', '.join(config['risk_scenarios'])}")
-    print(f"   📁 Output: {config['output_directory']}")
+    capital_scenarios = config['capital_scenarios']
+    risk_scenarios = config['risk_scenarios']
+    symbols = config['symbols']
+    timeframes = config['timeframes']
     
     # Calculate estimated duration
     days = (config['end_date'] - config['start_date']).days
-    symbols_count = len(config['symbols'])
-    timeframes_count = len(config['timeframes'])
-    scenarios_count = len(config['capital']) * len(config['risk_scenarios'])
-    
-    print(f"\n📈 SCOPE ESTIMATION:")
-    print(f"   📊 Trading Days: {days}")
-    print(f"   🔢 Total Combinations: {scenarios_count}")
-    print(f"   📦 Data Points: ~{days * 24 * symbols_count * timeframes_count:,}")
+    scenarios_count = len(capital_scenarios) * len(risk_scenarios)
     
     if days <= 60:
         estimated_time = "2-5 minutes"
@@ -276,7 +243,23 @@ def display_config(config):
     else:
         estimated_time = "30-60 minutes"
     
-    print(f"   ⏱️  Estimated Time: {estimated_time}")
+    # Build the whole summary up front and emit it with a single write
+    sys.stdout.write(
+        "📊 BACKTEST CONFIGURATION:\n"
+        f"{'-' * 50}\n"
+        f"   📅 Period: {config['start_date'].date()} to {config['end_date'].date()}\n"
+        f"   💰 Symbols: {', '.join(symbols)}\n"
+        f"   💵 Capital: {', '.join(map('${:,.0f}'.format, capital_scenarios))}\n"
+        f"   🕒 Timeframes: {', '.join(timeframes)}\n"
+        f"   ⚠️  Risk Scenarios: {', '.join(risk_scenarios)}\n"
+        f"   📁 Output: {config['output_directory']}\n"
+        "\n"
+        "📈 SCOPE ESTIMATION:\n"
+        f"   📊 Trading Days: {days}\n"
+        f"   🔢 Total Combinations: {scenarios_count}\n"
+        f"   📦 Data Points: ~{days * 24 * len(symbols) * len(timeframes):,}\n"
+        f"   ⏱️  Estimated Time: {estimated_time}\n"
+    )
 
 async def main():
     """Main execution function."""